@@ -396,9 +396,10 @@ class SkillManager:
     def get_status(self) -> Dict[str, Any]:
         """Get skill manager status."""
         available = self.get_available_skills()
-        by_category = {}
-        for cat in SkillCategory:
-            by_category[cat.value] = len([s for s in available if s.category == cat])
+        # Single pass over the skills instead of one scan per category
+        by_category = {cat.value: 0 for cat in SkillCategory}
+        for s in available:
+            by_category[s.category.value] += 1
         
         return {
             "total_skills": len(self._skills),
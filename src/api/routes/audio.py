@@ -20,6 +20,8 @@ logger = get_logger(__name__)
 settings = get_settings()
 router = APIRouter()
 
+_TTS_MEDIA_TYPES = {"mp3": "audio/mpeg", "wav": "audio/wav", "pcm": "application/octet-stream"}
+
 
 class TTSRequest(BaseModel):
     text: str
@@ -99,7 +101,7 @@ async def text_to_speech(
         except Exception as cost_error:
             logger.warning("tts_cost_logging_failed", error=str(cost_error))
 
-        media_type = {"mp3": "audio/mpeg", "wav": "audio/wav", "pcm": "application/octet-stream"}[req.format]
+        media_type = _TTS_MEDIA_TYPES[req.format]
         return Response(content=audio_bytes, media_type=media_type)
     except Exception as e:
         logger.error("tts_failed", error=str(e))
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy import inspect, or_
 from typing import List, Optional
 from pydantic import BaseModel, EmailStr
 import re
@@ -10,7 +10,7 @@ from datetime import datetime
 
 from src.database.database import get_db
 from src.database.models import Contact
-from src.utils.contact_parser import parse_vcard, parse_csv, normalize_contact_picker_data
+from src.utils.contact_parser import clean_phone, parse_vcard, parse_csv, normalize_contact_picker_data
 from src.utils.logging import get_logger
 from src.utils.rate_limit import limiter, get_rate_limit
 from src.utils.auth import require_user_id, filter_by_user
@@ -21,6 +21,9 @@ router = APIRouter()
 # File size limits (10MB)
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 MAX_BULK_CONTACTS = 1000  # Maximum contacts per bulk operation
+RELOAD_BATCH_SIZE = 500  # Primary keys per IN (...) when reloading created contacts
+
+_E164_RE = re.compile(r'^\+[1-9]\d{1,14}$')
 
 
 class ContactCreate(BaseModel):
@@ -66,11 +69,11 @@ def validate_phone_number(phone: Optional[str]) -> Optional[str]:
         return None
     
     # Remove all non-digit characters except +
-    cleaned = re.sub(r'[^\d+]', '', phone)
+    cleaned = clean_phone(phone)
     
     # Basic E.164 validation: + followed by 1-15 digits
     if cleaned.startswith('+'):
-        if re.match(r'^\+[1-9]\d{1,14}$', cleaned):
+        if _E164_RE.match(cleaned):
             return cleaned
     elif cleaned.isdigit():
         # Try to format as US number
@@ -82,6 +85,13 @@ def validate_phone_number(phone: Optional[str]) -> Optional[str]:
     return None
 
 
+def _reload_contacts(db: Session, contacts: List[Contact]) -> None:
+    """Reload committed contacts in batched SELECTs rather than one refresh() per row"""
+    ids = [inspect(c).identity[0] for c in contacts]
+    for i in range(0, len(ids), RELOAD_BATCH_SIZE):
+        db.query(Contact).filter(Contact.id.in_(ids[i:i + RELOAD_BATCH_SIZE])).all()
+
+
 @router.get("/", response_model=List[ContactResponse])
 @limiter.limit(get_rate_limit("contacts_list"))
 async def list_contacts(
@@ -198,8 +208,7 @@ async def bulk_create_contacts(
     
     db.commit()
     
-    for contact in created_contacts:
-        db.refresh(contact)
+    _reload_contacts(db, created_contacts)
     
     logger.info(f"bulk_contacts_created", count=len(created_contacts), user_id=user_id)
     return created_contacts
@@ -310,8 +319,7 @@ async def upload_vcard(
         
         db.commit()
         
-        for contact in created_contacts:
-            db.refresh(contact)
+        _reload_contacts(db, created_contacts)
         
         logger.info(f"vcard_uploaded", file=file.filename, contacts_created=len(created_contacts), user_id=user_id)
         return {
@@ -371,8 +379,7 @@ async def upload_csv(
         
         db.commit()
         
-        for contact in created_contacts:
-            db.refresh(contact)
+        _reload_contacts(db, created_contacts)
         
         logger.info(f"csv_uploaded", file=file.filename, contacts_created=len(created_contacts), user_id=user_id)
         return {
@@ -427,8 +434,7 @@ async def upload_from_picker(
         
         db.commit()
         
-        for contact in created_contacts:
-            db.refresh(contact)
+        _reload_contacts(db, created_contacts)
         
         logger.info(f"picker_contacts_uploaded", contacts_created=len(created_contacts), user_id=user_id)
         return {
@@ -1,13 +1,14 @@
 """Dashboard API routes for relationship intelligence and network views"""
 
 from fastapi import APIRouter, HTTPException, Depends, status
+from sqlalchemy import distinct, func
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 from pydantic import BaseModel
 from datetime import datetime, timedelta
 
 from src.database.database import get_db
-from src.database.models import Contact, ContactMemoryState, Commitment, Suggestion, Project
+from src.database.models import Contact, ContactMemoryState, Commitment, Suggestion, ProjectStakeholder
 from src.utils.logging import get_logger
 
 router = APIRouter()
@@ -98,24 +99,40 @@ async def get_network_heatmap(
         Contact.is_sensitive == False
     ).limit(limit).all()
     
-    heatmap_data = []
-    for contact in contacts:
-        memory_state = db.query(ContactMemoryState).filter(
-            ContactMemoryState.contact_id == contact.id
-        ).first()
+    # Fetch memory states and per-contact counts in one query each instead of per contact
+    contact_ids = [c.id for c in contacts]
+    memory_states: Dict[str, ContactMemoryState] = {}
+    project_counts: Dict[str, int] = {}
+    suggestion_counts: Dict[str, int] = {}
+    if contact_ids:
+        memory_states = {
+            m.contact_id: m
+            for m in db.query(ContactMemoryState).filter(
+                ContactMemoryState.contact_id.in_(contact_ids)
+            )
+        }
         
-        # Count connections (stakeholders in same projects)
-        project_count = db.query(Project).join(
-            "stakeholders"
-        ).filter(
-            Project.stakeholders.any(contact_id=contact.id)
-        ).count()
+        # Count connections (projects the contact is a stakeholder in)
+        project_counts = dict(
+            db.query(
+                ProjectStakeholder.contact_id,
+                func.count(distinct(ProjectStakeholder.project_id))
+            ).filter(
+                ProjectStakeholder.contact_id.in_(contact_ids)
+            ).group_by(ProjectStakeholder.contact_id).all()
+        )
         
         # Count active suggestions
-        suggestion_count = db.query(Suggestion).filter(
-            Suggestion.contact_id == contact.id,
-            Suggestion.status == "pending"
-        ).count()
+        suggestion_counts = dict(
+            db.query(Suggestion.contact_id, func.count(Suggestion.id)).filter(
+                Suggestion.contact_id.in_(contact_ids),
+                Suggestion.status == "pending"
+            ).group_by(Suggestion.contact_id).all()
+        )
+    
+    heatmap_data = []
+    for contact in contacts:
+        memory_state = memory_states.get(contact.id)
         
         heatmap_data.append({
             "contact_id": contact.id,
@@ -125,8 +142,8 @@ async def get_network_heatmap(
             "industries": contact.industries or [],
             "relationship_score": contact.relationship_score or 0.0,
             "sentiment_trend": memory_state.sentiment_trend if memory_state else None,
-            "project_count": project_count,
-            "suggestion_count": suggestion_count,
+            "project_count": project_counts.get(contact.id, 0),
+            "suggestion_count": suggestion_counts.get(contact.id, 0),
             "last_interaction": memory_state.last_interaction_at.isoformat() if memory_state and memory_state.last_interaction_at else None
         })
     
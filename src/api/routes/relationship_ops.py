@@ -17,13 +17,15 @@ from src.utils.logging import get_logger
 router = APIRouter()
 logger = get_logger(__name__)
 
+_RUN_TYPES = ("morning", "midday", "afternoon", "evening")
+
 
 # ============================================================================
 # PYDANTIC MODELS
 # ============================================================================
 
 class RunTriggerRequest(BaseModel):
-    run_type: str = Field(..., description="One of: morning, midday, afternoon, evening")
+    run_type: str = Field(..., description=f"One of: {', '.join(_RUN_TYPES)}")
     force: bool = Field(default=False, description="Force run even if already executed today")
 
 
@@ -107,10 +109,10 @@ async def trigger_run(
     Manually trigger a relationship ops run.
     The run executes in the background and returns immediately.
     """
-    if request.run_type not in ["morning", "midday", "afternoon", "evening"]:
+    if request.run_type not in _RUN_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid run_type: {request.run_type}. Must be one of: morning, midday, afternoon, evening"
+            detail=f"Invalid run_type: {request.run_type}. Must be one of: {', '.join(_RUN_TYPES)}"
         )
     
     service = RelationshipOpsService()
@@ -145,7 +147,7 @@ async def trigger_run_sync(
     Trigger a relationship ops run synchronously and wait for completion.
     Use for testing or when you need immediate results.
     """
-    if request.run_type not in ["morning", "midday", "afternoon", "evening"]:
+    if request.run_type not in _RUN_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid run_type: {request.run_type}"
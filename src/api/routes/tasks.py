@@ -1,5 +1,8 @@
 """Task management API routes (plan -> confirm -> execute)."""
 
+import asyncio
+import re
+
 from fastapi import APIRouter, HTTPException, status, Depends
 from pydantic import BaseModel
 from typing import Optional, Dict, Any, List
@@ -35,6 +38,20 @@ runtime_cost_tracker = RuntimeCostTracker()
 cost_logger = CostEventLogger()
 budget_manager = BudgetManager()
 
+# Patterns used to spot contacts mentioned in a task (compiled once at import)
+# Emails are tried first so digits inside an address aren't also taken as a phone number
+_CONTACT_MENTION_RE = re.compile(
+    r'(?P<email>\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b)'
+    r'|(?P<phone>\+?[1-9]\d{1,14})'
+)
+_CAPITALIZED_WORD_RE = re.compile(r'\b[A-Z][a-z]+\b')
+_COMMON_WORDS = frozenset({
+    'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 'as',
+    'is', 'was', 'are', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did',
+    'will', 'would', 'should', 'could', 'may', 'might', 'must', 'can', 'call', 'send', 'email',
+    'sms', 'text', 'message', 'about', 'meeting', 'schedule',
+})
+
 # Initialize database on module load
 try:
     init_db()
@@ -181,7 +198,8 @@ async def create_task(request: TaskRequest, db: Session = Depends(get_db)):
                 logger.warning("preference_resolution_failed", error=str(pref_error))
                 # Continue without preferences if resolution fails
             
-            plan = assistant.plan_task(request.task, enhanced_context)
+            # plan_task makes a blocking OpenAI call; keep it off the event loop
+            plan = await asyncio.to_thread(assistant.plan_task, request.task, enhanced_context)
             planned_tool_calls = plan.get("planned_tool_calls") or []
 
             # Persist assistant response into chat session (if present)
@@ -414,16 +432,20 @@ async def _enhance_context_with_memory(
     Returns:
         Enhanced context with memory information
     """
+    if not task or not task.strip():
+        return context
+    
     try:
         # Simple heuristic: look for phone numbers or emails in task
-        import re
         from difflib import SequenceMatcher
         
-        phone_pattern = r'\+?[1-9]\d{1,14}'
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        
-        phones = re.findall(phone_pattern, task)
-        emails = re.findall(email_pattern, task)
+        # One scan for both kinds of identifier; dicts dedupe while keeping order
+        # so repeated mentions don't repeat lookups
+        mentions: Dict[str, Dict[str, None]] = {"phone": {}, "email": {}}
+        for match in _CONTACT_MENTION_RE.finditer(task):
+            mentions[match.lastgroup][match.group()] = None
+        phones = list(mentions["phone"])
+        emails = list(mentions["email"])
         
         memory_contexts = []
         found_contact_ids = set()
@@ -453,18 +475,26 @@ async def _enhance_context_with_memory(
         
         # Try to find contacts by name using fuzzy matching
         # Extract potential names (capitalized words, 2+ characters, not common words)
-        common_words = {'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'from', 'as', 'is', 'was', 'are', 'were', 'be', 'been', 'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might', 'must', 'can', 'call', 'send', 'email', 'sms', 'text', 'message', 'to', 'about', 'meeting', 'call', 'schedule'}
-        
         # Extract capitalized words that might be names
-        words = re.findall(r'\b[A-Z][a-z]+\b', task)
-        potential_names = [w for w in words if w.lower() not in common_words and len(w) > 2]
+        words = _CAPITALIZED_WORD_RE.findall(task)
+        potential_names = list(dict.fromkeys(
+            w for w in words if w.lower() not in _COMMON_WORDS and len(w) > 2
+        ))
         
         # Get all contacts for fuzzy matching
         from src.database.models import Contact
-        all_contacts = db.query(Contact).all()
+        # No name-like words in the task: skip loading every contact
+        all_contacts = db.query(Contact).all() if potential_names else []
+        # Lowercase each contact's full name and name parts once, not per candidate name
+        lowered_contacts = [
+            (c, c.name.lower(), [part.lower() for part in c.name.split()])
+            for c in all_contacts
+        ]
+        contact_names = {name_lower for _, name_lower, _ in lowered_contacts}
         
         for potential_name in potential_names:
-            if potential_name.lower() in [c.name.lower() for c in all_contacts]:
+            candidate = potential_name.lower()
+            if candidate in contact_names:
                 # Exact match (case-insensitive)
                 contact = db.query(Contact).filter(
                     Contact.name.ilike(f"%{potential_name}%")
@@ -474,17 +504,16 @@ async def _enhance_context_with_memory(
                 best_match = None
                 best_score = 0.0
                 
-                for contact in all_contacts:
+                for contact, name_lower, parts_lower in lowered_contacts:
                     if contact.id in found_contact_ids:
                         continue
                     
                     # Try full name match
-                    similarity = SequenceMatcher(None, potential_name.lower(), contact.name.lower()).ratio()
+                    similarity = SequenceMatcher(None, candidate, name_lower).ratio()
                     
                     # Also try matching against first or last name
-                    name_parts = contact.name.split()
-                    for part in name_parts:
-                        part_similarity = SequenceMatcher(None, potential_name.lower(), part.lower()).ratio()
+                    for part in parts_lower:
+                        part_similarity = SequenceMatcher(None, candidate, part).ratio()
                         similarity = max(similarity, part_similarity)
                     
                     if similarity > best_score:
@@ -1,5 +1,7 @@
 """Twilio webhook handlers (Gather/Say fallback + optional Media Streams + Messaging)."""
 
+import asyncio
+
 from fastapi import APIRouter, Request, Response, HTTPException, status, WebSocket, Depends
 from fastapi.responses import JSONResponse
 from twilio.twiml.voice_response import VoiceResponse, Gather
@@ -161,7 +163,8 @@ async def twilio_voice_webhook(request: Request):
                     phone_number=from_number,
                 )
 
-                plan = assistant.plan_task(speech_result, context={})
+                # plan_task makes a blocking OpenAI call; keep it off the event loop
+                plan = await asyncio.to_thread(assistant.plan_task, speech_result, context={})
                 planned_calls = [
                     PlannedToolCall(name=c["name"], arguments=c.get("arguments") or {})
                     for c in (plan.get("planned_tool_calls") or [])
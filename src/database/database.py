@@ -84,6 +84,10 @@ if settings.DATABASE_URL:
         else:
             engine_kwargs["pool_size"] = int(os.getenv("DB_POOL_SIZE") or "5")
             engine_kwargs["max_overflow"] = int(os.getenv("DB_MAX_OVERFLOW") or "10")
+            # LIFO reuses the most recently returned (warm) connection and lets idle
+            # overflow connections age out; recycle before Neon/pgbouncer drops them.
+            engine_kwargs["pool_use_lifo"] = True
+            engine_kwargs["pool_recycle"] = int(os.getenv("DB_POOL_RECYCLE") or "1800")
 
         engine = create_engine(url, **engine_kwargs)
     except Exception as e:
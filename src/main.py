@@ -175,6 +175,20 @@ async def _start_background_tasks():
         logging.getLogger(__name__).info("background_tasks_disabled_for_runtime")
         return
     
+    def _with_session(fn, *args):
+        """Run fn(db, *args) on a fresh session (called via asyncio.to_thread)"""
+        from src.database.database import SessionLocal
+        db = SessionLocal()
+        try:
+            return fn(db, *args)
+        finally:
+            db.close()
+    
+    def _execute_relationship_run(db, service, run_type):
+        """Run a relationship ops run and read its result fields while the session is open"""
+        result = service.execute_run(db, run_type)
+        return result.id, len(result.top_actions or [])
+    
     async def _reminder_loop():
         while True:
             try:
@@ -185,7 +199,6 @@ async def _start_background_tasks():
     
     async def _commitment_update_loop():
         """Update overdue commitments daily"""
-        from src.database.database import SessionLocal
         while True:
             try:
                 # Wait until next day at 2 AM
@@ -193,14 +206,10 @@ async def _start_background_tasks():
                 from datetime import datetime
                 now = datetime.utcnow()
                 if now.hour == 2:  # Run at 2 AM UTC
-                    db = SessionLocal()
-                    try:
-                        count = _commitment_manager.update_overdue_commitments(db)
-                        if count > 0:
-                            import logging
-                            logging.getLogger(__name__).info(f"Updated {count} overdue commitments")
-                    finally:
-                        db.close()
+                    count = await asyncio.to_thread(_with_session, _commitment_manager.update_overdue_commitments)
+                    if count > 0:
+                        import logging
+                        logging.getLogger(__name__).info(f"Updated {count} overdue commitments")
             except Exception as e:
                 import logging
                 logging.getLogger(__name__).error(f"Commitment update loop error: {e}")
@@ -211,7 +220,6 @@ async def _start_background_tasks():
     
     async def _suggestion_expiration_loop():
         """Expire old suggestions daily"""
-        from src.database.database import SessionLocal
         from src.orchestrator.suggestion_manager import SuggestionManager
         while True:
             try:
@@ -219,21 +227,16 @@ async def _start_background_tasks():
                 from datetime import datetime
                 now = datetime.utcnow()
                 if now.hour == 3:  # Run at 3 AM UTC (after commitment updates)
-                    db = SessionLocal()
-                    try:
-                        count = SuggestionManager.expire_old_suggestions(db)
-                        if count > 0:
-                            import logging
-                            logging.getLogger(__name__).info(f"Expired {count} old suggestions")
-                    finally:
-                        db.close()
+                    count = await asyncio.to_thread(_with_session, SuggestionManager.expire_old_suggestions)
+                    if count > 0:
+                        import logging
+                        logging.getLogger(__name__).info(f"Expired {count} old suggestions")
             except Exception as e:
                 import logging
                 logging.getLogger(__name__).error(f"Suggestion expiration loop error: {e}")
     
     async def _daily_suggestion_generation():
         """Generate suggestions daily at 9 AM"""
-        from src.database.database import SessionLocal
         from src.orchestrator.orchestrator_service import OrchestratorService
         orchestrator = OrchestratorService()
         while True:
@@ -242,20 +245,15 @@ async def _start_background_tasks():
                 from datetime import datetime
                 now = datetime.utcnow()
                 if now.hour == 9:  # Run at 9 AM UTC
-                    db = SessionLocal()
-                    try:
-                        suggestions = orchestrator.generate_suggestions(db, limit=50)
-                        import logging
-                        logging.getLogger(__name__).info(f"Generated {len(suggestions)} daily suggestions")
-                    finally:
-                        db.close()
+                    suggestions = await asyncio.to_thread(_with_session, orchestrator.generate_suggestions, 50)
+                    import logging
+                    logging.getLogger(__name__).info(f"Generated {len(suggestions)} daily suggestions")
             except Exception as e:
                 import logging
                 logging.getLogger(__name__).error(f"Daily suggestion generation error: {e}")
     
     async def _weekly_review_generation():
         """Generate weekly review on Mondays at 8 AM"""
-        from src.database.database import SessionLocal
         from src.orchestrator.weekly_review import WeeklyReviewGenerator
         review_gen = WeeklyReviewGenerator()
         while True:
@@ -264,34 +262,25 @@ async def _start_background_tasks():
                 from datetime import datetime
                 now = datetime.utcnow()
                 if now.weekday() == 0 and now.hour == 8:  # Monday at 8 AM UTC
-                    db = SessionLocal()
-                    try:
-                        review = review_gen.generate_weekly_review(db)
-                        import logging
-                        logging.getLogger(__name__).info("Weekly review generated", week_start=review.get("week_start"))
-                        # TODO: Send review via email/notification
-                    finally:
-                        db.close()
+                    review = await asyncio.to_thread(_with_session, review_gen.generate_weekly_review)
+                    import logging
+                    logging.getLogger(__name__).info("Weekly review generated", week_start=review.get("week_start"))
+                    # TODO: Send review via email/notification
             except Exception as e:
                 import logging
                 logging.getLogger(__name__).error(f"Weekly review generation error: {e}")
     
     async def _budget_check_loop():
         """Check budgets and generate alerts periodically"""
-        from src.database.database import SessionLocal
         from src.cost.budget_manager import BudgetManager
         budget_manager = BudgetManager()
         while True:
             try:
                 await asyncio.sleep(3600)  # Check every hour
-                db = SessionLocal()
-                try:
-                    alerts = budget_manager.check_budgets(db)
-                    if alerts:
-                        import logging
-                        logging.getLogger(__name__).info(f"Generated {len(alerts)} budget alerts")
-                finally:
-                    db.close()
+                alerts = await asyncio.to_thread(_with_session, budget_manager.check_budgets)
+                if alerts:
+                    import logging
+                    logging.getLogger(__name__).info(f"Generated {len(alerts)} budget alerts")
             except Exception as e:
                 import logging
                 logging.getLogger(__name__).error(f"Budget check loop error: {e}")
@@ -307,7 +296,6 @@ async def _start_background_tasks():
         - 8:00 PM: Relationship Review + Next-Day Prep
         """
         import pytz
-        from src.database.database import SessionLocal
         from src.orchestrator.relationship_ops import RelationshipOpsService
         
         tz = pytz.timezone("America/New_York")
@@ -332,20 +320,19 @@ async def _start_background_tasks():
                 
                 for hour, minute, run_type in schedules:
                     if current_hour == hour and current_minute == minute:
-                        db = SessionLocal()
                         try:
                             import logging
                             logging.getLogger(__name__).info(f"Starting relationship ops {run_type} run")
-                            result = service.execute_run(db, run_type)
+                            run_id, action_count = await asyncio.to_thread(
+                                _with_session, _execute_relationship_run, service, run_type
+                            )
                             logging.getLogger(__name__).info(
-                                f"Relationship ops {run_type} run completed: {result.id}",
-                                extra={"actions": len(result.top_actions or [])}
+                                f"Relationship ops {run_type} run completed: {run_id}",
+                                extra={"actions": action_count}
                             )
                         except Exception as e:
                             import logging
                             logging.getLogger(__name__).error(f"Relationship ops {run_type} run failed: {e}")
-                        finally:
-                            db.close()
                         
                         # Wait 61 seconds to avoid re-triggering in same minute
                         await asyncio.sleep(61)
@@ -365,6 +352,13 @@ async def _start_background_tasks():
     asyncio.create_task(_relationship_ops_scheduler())
 
 
+@app.on_event("shutdown")
+async def _close_http_clients():
+    """Close shared HTTP clients"""
+    from src.tools.web_research import close_http_client
+    await close_http_client()
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
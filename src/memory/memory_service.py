@@ -535,7 +535,6 @@ Focus on:
                     # Update existing commitment if deadline is more specific
                     if deadline and (not existing.deadline or deadline < existing.deadline):
                         existing.deadline = deadline
-                        db.commit()
                     continue
                 
                 # Create new commitment
@@ -636,8 +635,8 @@ Provide a concise description of the current relationship status and dynamics.""
         """
         # Try cache first
         if use_cache:
+            from src.utils.cache_decorator import get_redis_client, note_redis_error
             try:
-                from src.utils.cache_decorator import get_redis_client
                 redis_client = get_redis_client()
                 if redis_client:
                     cache_key = f"contact_context:{contact_id}"
@@ -648,6 +647,7 @@ Provide a concise description of the current relationship status and dynamics.""
                         return json.loads(cached)
             except Exception as e:
                 logger.warning("cache_lookup_failed", error=str(e))
+                note_redis_error(e)
         
         memory_state = db.query(ContactMemoryState).filter(
             ContactMemoryState.contact_id == contact_id
@@ -686,8 +686,8 @@ Provide a concise description of the current relationship status and dynamics.""
         
         # Cache result (5 minute TTL)
         if use_cache:
+            from src.utils.cache_decorator import get_redis_client, note_redis_error
             try:
-                from src.utils.cache_decorator import get_redis_client
                 redis_client = get_redis_client()
                 if redis_client:
                     cache_key = f"contact_context:{contact_id}"
@@ -700,6 +700,7 @@ Provide a concise description of the current relationship status and dynamics.""
                     logger.debug("contact_context_cached", contact_id=contact_id)
             except Exception as e:
                 logger.warning("cache_store_failed", error=str(e))
+                note_redis_error(e)
         
         return result
     
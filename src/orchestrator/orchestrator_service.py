@@ -949,10 +949,9 @@ Respond with JSON:
                 status="active"
             )
             db.add(project)
-            db.commit()
-            db.refresh(project)
+            db.flush()
             
-            # Create tasks
+            # Create tasks (flushed for IDs, committed once with the project)
             from src.database.models import ProjectTask
             created_tasks = []
             task_map = {}  # Map task index to task ID for dependencies
@@ -979,13 +978,12 @@ Respond with JSON:
                     status="todo"
                 )
                 db.add(task)
-                db.commit()
-                db.refresh(task)
+                db.flush()
                 
                 task_map[idx] = task.id
                 created_tasks.append(task)
             
-            return {
+            plan = {
                 "project_id": project.id,
                 "project_title": project.title,
                 "tasks_created": len(created_tasks),
@@ -999,6 +997,8 @@ Respond with JSON:
                     for t in created_tasks
                 ]
             }
+            db.commit()
+            return plan
         except Exception as e:
             logger.error("project_plan_generation_failed", error=str(e))
             raise
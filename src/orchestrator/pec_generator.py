@@ -5,6 +5,7 @@ Generates structured confirmation artifacts that validate project scope, plan,
 tool feasibility, constraints, and risks before execution.
 """
 
+from collections import Counter
 from typing import Dict, Any, Optional, List, Tuple
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
@@ -909,8 +910,9 @@ Respond with JSON:
         has_questions = False
         
         # Check task feasibility
-        blocked_count = sum(1 for t in task_tool_map if t["feasibility"] == "BLOCKED")
-        partial_count = sum(1 for t in task_tool_map if t["feasibility"] == "PARTIAL")
+        feasibility_counts = Counter(t["feasibility"] for t in task_tool_map)
+        blocked_count = feasibility_counts["BLOCKED"]
+        partial_count = feasibility_counts["PARTIAL"]
         
         if blocked_count > 0:
             has_blocked = True
@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional, Tuple
 
 from src.utils.config import get_settings
@@ -70,30 +71,35 @@ def is_godfather(actor: Actor) -> bool:
     return False
 
 
+_HIGH_RISK_TOOLS = MappingProxyType({
+    "make_call": "initiates an outbound call",
+    "send_sms": "sends an SMS",
+    "send_email": "sends an email",
+    "calendar_create_event": "creates a calendar event",
+    "calendar_update_event": "updates a calendar event",
+    "calendar_cancel_event": "cancels a calendar event",
+})
+
+_LOW_RISK_TOOLS = MappingProxyType({
+    "web_research": "performs web research (read-only)",
+    "read_email": "reads email content (read-only)",
+    "list_emails": "lists/searches email (read-only)",
+    "calendar_list_upcoming": "lists calendar events (read-only)",
+})
+
+
 def tool_risk(tool_name: str) -> Tuple[Risk, List[str]]:
     """
     Classify tool calls.
     High-risk: contacting people or modifying calendar.
     Low-risk: research/summarization.
     """
-    high = {
-        "make_call": "initiates an outbound call",
-        "send_sms": "sends an SMS",
-        "send_email": "sends an email",
-        "calendar_create_event": "creates a calendar event",
-        "calendar_update_event": "updates a calendar event",
-        "calendar_cancel_event": "cancels a calendar event",
-    }
-    low = {
-        "web_research": "performs web research (read-only)",
-        "read_email": "reads email content (read-only)",
-        "list_emails": "lists/searches email (read-only)",
-        "calendar_list_upcoming": "lists calendar events (read-only)",
-    }
-    if tool_name in high:
-        return Risk.HIGH, [high[tool_name]]
-    if tool_name in low:
-        return Risk.LOW, [low[tool_name]]
+    reason = _HIGH_RISK_TOOLS.get(tool_name)
+    if reason is not None:
+        return Risk.HIGH, [reason]
+    reason = _LOW_RISK_TOOLS.get(tool_name)
+    if reason is not None:
+        return Risk.LOW, [reason]
     # Unknown tools default to high until reviewed
     return Risk.HIGH, ["unknown tool (default-high)"]
 
@@ -31,11 +31,12 @@ class ServiceRegistry:
     
     def get_or_create(self, name: str, factory: callable) -> Any:
         """Get existing service or create new one using factory"""
-        if name not in self._services:
+        service = self._services.get(name)
+        if service is None:
             logger.info("creating_service", service_name=name)
             service = factory()
             self.register(name, service)
-        return self._services[name]
+        return service
     
     def has(self, name: str) -> bool:
         """Check if service is registered"""
@@ -108,41 +109,51 @@ def get_service_registry() -> ServiceRegistry:
 def get_twilio_service():
     """Get TwilioService instance"""
     registry = get_service_registry()
-    if not registry.has("twilio"):
+    service = registry.get("twilio")
+    if service is None:
         registry.initialize_services()
-    return registry.get("twilio")
+        service = registry.get("twilio")
+    return service
 
 
 def get_messaging_service():
     """Get MessagingService instance"""
     registry = get_service_registry()
-    if not registry.has("messaging"):
+    service = registry.get("messaging")
+    if service is None:
         registry.initialize_services()
-    return registry.get("messaging")
+        service = registry.get("messaging")
+    return service
 
 
 def get_memory_service():
     """Get MemoryService instance"""
     registry = get_service_registry()
-    if not registry.has("memory"):
+    service = registry.get("memory")
+    if service is None:
         registry.initialize_services()
-    return registry.get("memory")
+        service = registry.get("memory")
+    return service
 
 
 def get_voice_assistant():
     """Get VoiceAssistant instance"""
     registry = get_service_registry()
-    if not registry.has("voice_assistant"):
+    service = registry.get("voice_assistant")
+    if service is None:
         registry.initialize_services()
-    return registry.get("voice_assistant")
+        service = registry.get("voice_assistant")
+    return service
 
 
 def get_orchestrator_service():
     """Get OrchestratorService instance"""
     registry = get_service_registry()
-    if not registry.has("orchestrator"):
+    service = registry.get("orchestrator")
+    if service is None:
         registry.initialize_services()
-    return registry.get("orchestrator")
+        service = registry.get("orchestrator")
+    return service
 
 
 def get_realtime_bridge():
@@ -2,74 +2,193 @@
 
 from __future__ import annotations
 
+import json
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 from urllib.parse import urlparse
 
 import httpx
 
+from src.utils.cache_decorator import get_async_redis_client, hash_key, note_redis_error
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Fetched pages are kept with their validators so repeat fetches can be answered by a 304.
+_PAGE_CACHE_TTL = 24 * 3600
 
-_DEFAULT_ALLOW_HOSTS = {
+
+_DEFAULT_ALLOW_HOSTS = frozenset({
     "en.wikipedia.org",
     "developer.mozilla.org",
     "docs.python.org",
     "fastapi.tiangolo.com",
-}
+})
+
+
+# Research fetches hit a handful of allowlisted hosts, so keep a few warm connections per host.
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60.0)
+# Read/write timeouts come from each fetch's timeout_s; connect and pool waits are capped here.
+_HTTP_CONNECT_TIMEOUT = 5.0
+_HTTP_POOL_TIMEOUT = 5.0
+
+_http_client: Optional[httpx.AsyncClient] = None
+
 
+def _get_http_client() -> httpx.AsyncClient:
+    """Shared client so repeated fetches reuse pooled connections instead of reconnecting per URL."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            follow_redirects=True,
+            limits=_HTTP_LIMITS,
+            headers={"User-Agent": "GodfatherAssistant/1.0"},
+        )
+    return _http_client
 
-def _is_public_http_url(url: str) -> bool:
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on app shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _http_host(url: str) -> Optional[str]:
+    """Parse the URL once: lowercase host for http(s) URLs, None otherwise."""
     try:
         u = urlparse(url)
-        return u.scheme in {"http", "https"} and bool(u.netloc)
     except Exception:
+        return None
+    if u.scheme not in {"http", "https"} or not u.netloc:
+        return None
+    return (u.hostname or "").lower()
+
+
+@lru_cache(maxsize=32)
+def _extra_allow_hosts(allow_hosts_csv: str) -> frozenset:
+    return frozenset(h.strip().lower() for h in allow_hosts_csv.split(",") if h.strip())
+
+
+def _is_allowed_host(host: str, allow_hosts_csv: Optional[str] = None) -> bool:
+    # Default hosts are a constant set lookup; extra hosts are parsed once per distinct CSV.
+    if host in _DEFAULT_ALLOW_HOSTS:
+        return True
+    if not allow_hosts_csv:
         return False
+    return host in _extra_allow_hosts(allow_hosts_csv)
 
 
-def _host(url: str) -> str:
+async def _get_cached_page(cache_key: str) -> Optional[Dict[str, Any]]:
+    redis_client = get_async_redis_client()
+    if not redis_client:
+        return None
     try:
-        return (urlparse(url).hostname or "").lower()
-    except Exception:
-        return ""
+        cached = await redis_client.get(cache_key)
+        return json.loads(cached) if cached else None
+    except Exception as e:
+        logger.warning("web_research_cache_get_error", error=str(e))
+        note_redis_error(e)
+        return None
+
+
+async def _set_cached_page(cache_key: str, page: Dict[str, Any]) -> None:
+    redis_client = get_async_redis_client()
+    if not redis_client:
+        return
+    try:
+        await redis_client.setex(cache_key, _PAGE_CACHE_TTL, json.dumps(page))
+    except Exception as e:
+        logger.warning("web_research_cache_set_error", error=str(e))
+        note_redis_error(e)
+
+
+async def _touch_cached_page(cache_key: str) -> None:
+    """Restart the TTL of a page the server just confirmed is unchanged."""
+    redis_client = get_async_redis_client()
+    if not redis_client:
+        return
+    try:
+        await redis_client.expire(cache_key, _PAGE_CACHE_TTL)
+    except Exception as e:
+        logger.warning("web_research_cache_set_error", error=str(e))
+        note_redis_error(e)
 
 
 async def fetch_url(url: str, timeout_s: float = 10.0, max_bytes: int = 2_000_000) -> str:
-    if not _is_public_http_url(url):
+    if _http_host(url) is None:
         raise ValueError("Invalid URL")
-    async with httpx.AsyncClient(follow_redirects=True, timeout=timeout_s, headers={"User-Agent": "GodfatherAssistant/1.0"}) as client:
-        r = await client.get(url)
+    return await _fetch(url, timeout_s=timeout_s, max_bytes=max_bytes)
+
+
+async def _fetch(url: str, timeout_s: float = 10.0, max_bytes: int = 2_000_000) -> str:
+    cache_key = f"web_research:{hash_key(url)}"
+    cached = await _get_cached_page(cache_key)
+    headers = {}
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    timeout = httpx.Timeout(timeout_s, connect=min(timeout_s, _HTTP_CONNECT_TIMEOUT), pool=_HTTP_POOL_TIMEOUT)
+    async with _get_http_client().stream("GET", url, timeout=timeout, headers=headers) as r:
+        if r.status_code == 304 and cached:
+            logger.debug("web_research_not_modified", url=url)
+            await _touch_cached_page(cache_key)
+            # The cached body is a full read; apply this call's cap like a fresh download.
+            return cached["body"].encode("utf-8")[:max_bytes].decode("utf-8", errors="ignore")
         r.raise_for_status()
-        content = r.text
-        if len(content.encode("utf-8", errors="ignore")) > max_bytes:
-            content = content[: max_bytes]
+        # Stop reading once max_bytes have arrived instead of buffering the whole page.
+        chunks: List[bytes] = []
+        received = 0
+        async for chunk in r.aiter_bytes(65536):
+            chunks.append(chunk)
+            received += len(chunk)
+            if received >= max_bytes:
+                break
+        content = b"".join(chunks)[:max_bytes].decode(r.encoding or "utf-8", errors="replace")
+
+    # A truncated body does not match the validators, so only full reads are cached.
+    if received >= max_bytes:
         return content
+    etag = r.headers.get("etag")
+    last_modified = r.headers.get("last-modified")
+    if etag or last_modified:
+        await _set_cached_page(cache_key, {"body": content, "etag": etag, "last_modified": last_modified})
+    return content
+
+
+# One alternation strips script/style blocks and remaining tags in a single scan;
+# the unrolled [^<]* loops avoid lazy .*? backtracking.
+_HTML_CLEAN_RE = re.compile(
+    r"<script\b[^>]*>[^<]*(?:<(?!/script\s*>)[^<]*)*</script\s*>"
+    r"|<style\b[^>]*>[^<]*(?:<(?!/style\s*>)[^<]*)*</style\s*>"
+    r"|<[^>]+>",
+    re.IGNORECASE,
+)
+_WS_RE = re.compile(r"\s+")
 
 
 def strip_html(text: str) -> str:
     # Extremely simple HTML stripping for v1 (good enough for short summaries).
-    text = re.sub(r"(?is)<script.*?>.*?</script>", " ", text)
-    text = re.sub(r"(?is)<style.*?>.*?</style>", " ", text)
-    text = re.sub(r"(?s)<.*?>", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
+    return _WS_RE.sub(" ", _HTML_CLEAN_RE.sub(" ", text)).strip()
 
 
 async def web_research(url: str, allow_hosts_csv: Optional[str] = None) -> Dict[str, Any]:
     """
     Fetch a URL (allowlisted by host) and return clean text suitable for summarization.
     """
-    host = _host(url)
-    allow = set(_DEFAULT_ALLOW_HOSTS)
-    if allow_hosts_csv:
-        allow |= {h.strip().lower() for h in allow_hosts_csv.split(",") if h.strip()}
-    if host not in allow:
+    host = _http_host(url)
+    if host is None:
+        raise ValueError("Invalid URL")
+    if not _is_allowed_host(host, allow_hosts_csv):
         raise ValueError(f"Host not allowlisted: {host}")
 
-    html = await fetch_url(url)
+    html = await _fetch(url)
     text = strip_html(html)
     logger.info("web_research_fetched", url=url, host=host, chars=len(text))
     return {"url": url, "host": host, "text": text[:20000]}
@@ -2,9 +2,17 @@
 
 import json
 import hashlib
+import time
 from functools import wraps
 from typing import Callable, Optional, Any
-import redis
+
+try:
+    import redis
+    import redis.asyncio as aioredis
+except ImportError:
+    # redis is optional (not in the Vercel requirements); caching is simply disabled
+    redis = None
+    aioredis = None
 
 from src.utils.config import get_settings
 from src.utils.logging import get_logger
@@ -13,21 +21,80 @@ logger = get_logger(__name__)
 settings = get_settings()
 
 _redis_client = None
+_async_redis_client = None
+
+# After a connection failure, skip Redis entirely for a short cool-down instead of
+# paying a connect timeout on every cached call while it is down.
+_REDIS_COOLDOWN_SECONDS = 30.0
+_redis_down_until = 0.0
+
+# Short socket timeouts so an unreachable host fails fast and starts the cool-down
+# instead of hanging each call until the OS gives up on the TCP connect.
+_REDIS_CONNECT_TIMEOUT = 1.0
+_REDIS_SOCKET_TIMEOUT = 1.0
 
 
 def get_redis_client():
     """Get Redis client (singleton)"""
     global _redis_client
-    if _redis_client is None:
+    if time.monotonic() < _redis_down_until:
+        return None
+    if _redis_client is None and redis is not None and settings.REDIS_URL:
         try:
-            _redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+            _redis_client = redis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=_REDIS_CONNECT_TIMEOUT,
+                socket_timeout=_REDIS_SOCKET_TIMEOUT,
+            )
             _redis_client.ping()
         except Exception as e:
             logger.warning("redis_cache_unavailable", error=str(e))
             _redis_client = None
+            note_redis_error(e)
     return _redis_client
 
 
+def hash_key(raw: str) -> str:
+    """Short, stable digest for cache keys (BLAKE2b is faster than MD5 in CPython)"""
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+
+
+def get_async_redis_client():
+    """
+    Get asyncio Redis client (singleton)
+    
+    The client owns a single connection pool shared by every cached coroutine,
+    so lookups reuse open connections and never block the event loop.
+    """
+    global _async_redis_client
+    if time.monotonic() < _redis_down_until:
+        return None
+    if _async_redis_client is None and aioredis is not None and settings.REDIS_URL:
+        try:
+            _async_redis_client = aioredis.from_url(
+                settings.REDIS_URL,
+                decode_responses=True,
+                max_connections=64,
+                socket_connect_timeout=_REDIS_CONNECT_TIMEOUT,
+                socket_timeout=_REDIS_SOCKET_TIMEOUT,
+            )
+        except Exception as e:
+            logger.warning("redis_cache_unavailable", error=str(e))
+            _async_redis_client = None
+    return _async_redis_client
+
+
+def note_redis_error(error: Exception) -> None:
+    """Start the cool-down if a cache call failed because Redis is unreachable"""
+    global _redis_down_until
+    if redis is None:
+        return
+    if isinstance(error, (redis.exceptions.ConnectionError, redis.exceptions.TimeoutError)):
+        _redis_down_until = time.monotonic() + _REDIS_COOLDOWN_SECONDS
+        logger.warning("redis_cache_cooldown", seconds=_REDIS_COOLDOWN_SECONDS, error=str(error))
+
+
 def cache_response(ttl: int = 300, key_prefix: str = "api_cache"):
     """
     Decorator to cache API response
@@ -53,26 +120,28 @@ def cache_response(ttl: int = 300, key_prefix: str = "api_cache"):
                 if isinstance(value, (str, int, float, bool)):
                     cache_key_parts.append(f"{key}:{value}")
             
-            cache_key = f"{key_prefix}:{hashlib.md5(':'.join(cache_key_parts).encode()).hexdigest()}"
+            cache_key = f"{key_prefix}:{hash_key(':'.join(cache_key_parts))}"
             
             # Try to get from cache
-            redis_client = get_redis_client()
+            redis_client = get_async_redis_client()
             if redis_client:
                 try:
-                    cached = redis_client.get(cache_key)
+                    cached = await redis_client.get(cache_key)
                     if cached:
                         logger.debug("cache_hit", key=cache_key)
                         return json.loads(cached)
                 except Exception as e:
                     logger.warning("cache_get_error", error=str(e))
+                    note_redis_error(e)
             
             # Execute function
             result = await func(*args, **kwargs)
             
-            # Cache result
+            # Cache result (re-checked: a failed lookup may have started the cool-down)
+            redis_client = get_async_redis_client()
             if redis_client:
                 try:
-                    redis_client.setex(
+                    await redis_client.setex(
                         cache_key,
                         ttl,
                         json.dumps(result, default=str)
@@ -80,23 +149,35 @@ def cache_response(ttl: int = 300, key_prefix: str = "api_cache"):
                     logger.debug("cache_set", key=cache_key, ttl=ttl)
                 except Exception as e:
                     logger.warning("cache_set_error", error=str(e))
+                    note_redis_error(e)
             
             return result
         return wrapper
     return decorator
 
 
-def invalidate_cache(pattern: str):
+def invalidate_cache(pattern: str, batch_size: int = 500):
     """Invalidate cache entries matching pattern"""
     redis_client = get_redis_client()
     if not redis_client:
         return
     
     try:
-        keys = redis_client.keys(pattern)
-        if keys:
-            redis_client.delete(*keys)
-            logger.info("cache_invalidated", pattern=pattern, count=len(keys))
+        # SCAN walks the keyspace incrementally instead of blocking Redis like KEYS,
+        # and UNLINK reclaims memory in the background instead of on the main thread
+        count = 0
+        batch = []
+        for key in redis_client.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                redis_client.unlink(*batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            redis_client.unlink(*batch)
+            count += len(batch)
+        if count:
+            logger.info("cache_invalidated", pattern=pattern, count=count)
     except Exception as e:
         logger.warning("cache_invalidation_error", error=str(e))
-
+        note_redis_error(e)
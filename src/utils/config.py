@@ -96,6 +96,9 @@ class Settings(BaseSettings):
     # Database (Neon PostgreSQL)
     DATABASE_URL: str = ""
 
+    # Redis (optional response cache; caching is disabled when empty)
+    REDIS_URL: str = ""
+
     # CORS
     CORS_ORIGINS: List[str] = ["*"]
 
@@ -4,7 +4,14 @@ import csv
 import io
 import re
 from typing import List, Dict, Optional, Any
-import vobject
+# vobject is imported lazily in parse_vcard; only vCard uploads need it.
+
+_PHONE_CLEAN_RE = re.compile(r'[^\d+]')
+
+
+def clean_phone(phone: str) -> str:
+    """Strip everything from a phone number except digits and '+'"""
+    return _PHONE_CLEAN_RE.sub('', phone)
 
 
 def parse_vcard(vcard_content: str) -> List[Dict[str, Any]]:
@@ -17,6 +24,8 @@ def parse_vcard(vcard_content: str) -> List[Dict[str, Any]]:
     Returns:
         List of contact dictionaries with keys: name, phone_number, email, organization, notes
     """
+    import vobject
+
     contacts = []
     
     try:
@@ -47,7 +56,7 @@ def parse_vcard(vcard_content: str) -> List[Dict[str, Any]]:
             if hasattr(vcard, 'tel_list') and vcard.tel_list:
                 phone = vcard.tel_list[0].value
                 # Clean phone number (remove non-digits except +)
-                phone = re.sub(r'[^\d+]', '', phone)
+                phone = clean_phone(phone)
                 if phone:
                     # Ensure E.164 format (add + if not present and it's a valid number)
                     if not phone.startswith('+') and phone[0].isdigit():
@@ -86,6 +95,22 @@ def parse_vcard(vcard_content: str) -> List[Dict[str, Any]]:
     return contacts
 
 
+# Normalize column names (case-insensitive, handle variations)
+_CSV_FIELD_ALIASES: Dict[str, str] = {
+    alias: field
+    for field, aliases in {
+        'name': ['name', 'full name', 'fullname', 'contact name'],
+        'phone_number': ['phone_number', 'phone', 'phone number', 'mobile', 'tel'],
+        'email': ['email', 'e-mail', 'email address'],
+        'organization': ['organization', 'org', 'company', 'work'],
+        'notes': ['notes', 'note', 'comments', 'description'],
+    }.items()
+    for alias in aliases
+}
+_CSV_FIELDS = ('name', 'phone_number', 'email', 'organization', 'notes')
+_CSV_DELIMITERS = ',;\t|'
+
+
 def parse_csv(csv_content: str) -> List[Dict[str, Any]]:
     """
     Parse CSV file content into list of contact dictionaries
@@ -103,20 +128,21 @@ def parse_csv(csv_content: str) -> List[Dict[str, Any]]:
     contacts = []
     
     try:
-        # Try to detect delimiter
-        sniffer = csv.Sniffer()
-        delimiter = sniffer.sniff(csv_content[:1024]).delimiter
+        # Try to detect delimiter from a bounded prefix, only considering real
+        # CSV delimiters; single-column files fall back to a comma
+        try:
+            delimiter = csv.Sniffer().sniff(csv_content[:4096], delimiters=_CSV_DELIMITERS).delimiter
+        except csv.Error:
+            delimiter = ','
         
         reader = csv.DictReader(io.StringIO(csv_content), delimiter=delimiter)
         
-        # Normalize column names (case-insensitive, handle variations)
-        field_mapping = {
-            'name': ['name', 'full name', 'fullname', 'contact name'],
-            'phone_number': ['phone_number', 'phone', 'phone number', 'mobile', 'tel'],
-            'email': ['email', 'e-mail', 'email address'],
-            'organization': ['organization', 'org', 'company', 'work'],
-            'notes': ['notes', 'note', 'comments', 'description'],
-        }
+        # Resolve header -> field once per file instead of per row and per column
+        columns_by_field: Dict[str, List[str]] = {field: [] for field in _CSV_FIELDS}
+        for col_name in reader.fieldnames or []:
+            field = _CSV_FIELD_ALIASES.get(col_name.lower().strip())
+            if field:
+                columns_by_field[field].append(col_name)
         
         for row in reader:
             contact = {
@@ -128,21 +154,20 @@ def parse_csv(csv_content: str) -> List[Dict[str, Any]]:
             }
             
             # Map fields
-            for field, possible_names in field_mapping.items():
-                for col_name in row.keys():
-                    if col_name.lower().strip() in [n.lower() for n in possible_names]:
-                        value = row[col_name].strip() if row[col_name] else None
-                        if value:
-                            # Clean phone numbers
-                            if field == "phone_number":
-                                value = re.sub(r'[^\d+]', '', value)
-                                if value and not value.startswith('+'):
-                                    if len(value) == 10:
-                                        value = f"+1{value}"
-                                    elif len(value) == 11 and value[0] == '1':
-                                        value = f"+{value}"
-                            contact[field] = value
-                            break
+            for field, columns in columns_by_field.items():
+                for col_name in columns:
+                    value = row[col_name].strip() if row[col_name] else None
+                    if value:
+                        # Clean phone numbers
+                        if field == "phone_number":
+                            value = clean_phone(value)
+                            if value and not value.startswith('+'):
+                                if len(value) == 10:
+                                    value = f"+1{value}"
+                                elif len(value) == 11 and value[0] == '1':
+                                    value = f"+{value}"
+                        contact[field] = value
+                        break
             
             # Only add contact if it has at least a name
             if contact["name"]:
@@ -187,7 +212,7 @@ def normalize_contact_picker_data(contact_data: Dict[str, Any]) -> Dict[str, Any
             phone = contact_data["tel"][0]
             if isinstance(phone, dict):
                 phone = phone.get("value", phone.get("number", ""))
-            phone = re.sub(r'[^\d+]', '', str(phone))
+            phone = clean_phone(str(phone))
             if phone:
                 if not phone.startswith('+'):
                     if len(phone) == 10:
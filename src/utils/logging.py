@@ -49,20 +49,19 @@ except ImportError:
     # Adapt logger to accept arbitrary kwargs (e.g., logger.info(..., project_id=""))
     # by tucking them under LogRecord.extra.context so standard logging won't error.
     class ContextAdapter(logging.LoggerAdapter):
+        # Keep standard logging kwargs intact
+        _PASSTHROUGH_KEYS = frozenset({"exc_info", "stack_info", "stacklevel"})
+
         def process(self, msg, kwargs):
             extra = kwargs.pop("extra", {})
-            # Keep standard logging kwargs intact
-            passthrough_keys = {"exc_info", "stack_info", "stacklevel"}
-            passthrough = {k: kwargs.pop(k) for k in list(kwargs.keys()) if k in passthrough_keys}
+            passthrough = {k: kwargs.pop(k) for k in self._PASSTHROUGH_KEYS & kwargs.keys()}
 
-            merged: dict[str, Any] = {}
             if isinstance(extra, dict):
-                merged.update(extra)
+                merged: dict[str, Any] = {**extra, **kwargs}
             elif extra:
-                merged["_extra"] = extra
-
-            if kwargs:
-                merged.update(kwargs)
+                merged = {"_extra": extra, **kwargs}
+            else:
+                merged = kwargs
 
             if merged:
                 passthrough["extra"] = {"context": merged}
@@ -1,7 +1,10 @@
 """Retry logic with exponential backoff"""
 
+import asyncio
 import time
 import random
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from functools import wraps
 from typing import Callable, Type, Tuple, Optional
 from src.utils.logging import get_logger
@@ -9,6 +12,59 @@ from src.utils.logging import get_logger
 logger = get_logger(__name__)
 
 
+def _backoff_schedule(
+    max_retries: int,
+    initial_delay: float,
+    max_delay: float,
+    exponential_base: float,
+) -> Tuple[float, ...]:
+    """Precompute the (un-jittered) delay before each retry"""
+    return tuple(
+        min(initial_delay * (exponential_base ** attempt), max_delay)
+        for attempt in range(max_retries)
+    )
+
+
+_RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+
+def _retry_after(exc: Exception) -> Optional[float]:
+    """
+    Seconds the server asked us to wait, if the exception carries a 429/503
+    response with a Retry-After header (delta-seconds or HTTP-date).
+    """
+    response = getattr(exc, "response", None)
+    if getattr(response, "status_code", None) not in _RETRY_AFTER_STATUSES:
+        return None
+    headers = getattr(response, "headers", None) or {}
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _next_delay(exc: Exception, delay: float, max_delay: float, jitter: bool) -> float:
+    """
+    Delay before the next attempt. Honors Retry-After (capped at max_delay) and
+    otherwise applies full jitter so concurrent callers don't retry in lockstep.
+    """
+    server_delay = _retry_after(exc)
+    if server_delay is not None:
+        server_delay = min(server_delay, max_delay)
+        return server_delay + (random.uniform(0, delay) if jitter else 0.0)
+    return random.uniform(0, delay) if jitter else delay
+
+
 def retry_with_backoff(
     max_retries: int = 3,
     initial_delay: float = 1.0,
@@ -25,41 +81,27 @@ def retry_with_backoff(
         initial_delay: Initial delay in seconds
         max_delay: Maximum delay in seconds
         exponential_base: Base for exponential backoff
-        jitter: Add random jitter to prevent thundering herd
+        jitter: Use full jitter (uniform in [0, delay]) to prevent thundering herd
         exceptions: Tuple of exceptions to catch and retry
     
+    Exceptions carrying a 429/503 response (e.g. httpx.HTTPStatusError) wait
+    for the server's Retry-After instead of the computed backoff.
+    
     Usage:
         @retry_with_backoff(max_retries=3, initial_delay=1.0)
         def my_function():
             ...
     """
+    delays = _backoff_schedule(max_retries, initial_delay, max_delay, exponential_base)
+
     def decorator(func: Callable):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            delay = initial_delay
-            last_exception = None
-            
-            for attempt in range(max_retries + 1):
+            for attempt, delay in enumerate(delays):
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    
-                    if attempt == max_retries:
-                        logger.error(
-                            "retry_exhausted",
-                            function=func.__name__,
-                            attempts=attempt + 1,
-                            error=str(e)
-                        )
-                        raise
-                    
-                    # Calculate delay with exponential backoff
-                    delay = min(initial_delay * (exponential_base ** attempt), max_delay)
-                    
-                    # Add jitter if enabled
-                    if jitter:
-                        delay = delay * (0.5 + random.random() * 0.5)
+                    delay = _next_delay(e, delay, max_delay, jitter)
                     
                     logger.warning(
                         "retry_attempt",
@@ -72,9 +114,17 @@ def retry_with_backoff(
                     
                     time.sleep(delay)
             
-            # Should never reach here, but just in case
-            if last_exception:
-                raise last_exception
+            # Final attempt: let the exception propagate
+            try:
+                return func(*args, **kwargs)
+            except exceptions as e:
+                logger.error(
+                    "retry_exhausted",
+                    function=func.__name__,
+                    attempts=max_retries + 1,
+                    error=str(e)
+                )
+                raise
                 
         return wrapper
     return decorator
@@ -96,33 +146,16 @@ def retry_async_with_backoff(
         async def my_async_function():
             ...
     """
+    delays = _backoff_schedule(max_retries, initial_delay, max_delay, exponential_base)
+
     def decorator(func: Callable):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            delay = initial_delay
-            last_exception = None
-            
-            for attempt in range(max_retries + 1):
+            for attempt, delay in enumerate(delays):
                 try:
                     return await func(*args, **kwargs)
                 except exceptions as e:
-                    last_exception = e
-                    
-                    if attempt == max_retries:
-                        logger.error(
-                            "retry_exhausted",
-                            function=func.__name__,
-                            attempts=attempt + 1,
-                            error=str(e)
-                        )
-                        raise
-                    
-                    # Calculate delay with exponential backoff
-                    delay = min(initial_delay * (exponential_base ** attempt), max_delay)
-                    
-                    # Add jitter if enabled
-                    if jitter:
-                        delay = delay * (0.5 + random.random() * 0.5)
+                    delay = _next_delay(e, delay, max_delay, jitter)
                     
                     logger.warning(
                         "retry_attempt",
@@ -133,13 +166,19 @@ def retry_async_with_backoff(
                         error=str(e)
                     )
                     
-                    import asyncio
                     await asyncio.sleep(delay)
             
-            # Should never reach here, but just in case
-            if last_exception:
-                raise last_exception
+            # Final attempt: let the exception propagate
+            try:
+                return await func(*args, **kwargs)
+            except exceptions as e:
+                logger.error(
+                    "retry_exhausted",
+                    function=func.__name__,
+                    attempts=max_retries + 1,
+                    error=str(e)
+                )
+                raise
                 
         return wrapper
     return decorator
-
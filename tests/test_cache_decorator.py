@@ -0,0 +1,67 @@
+"""Tests for the Redis response cache helpers"""
+
+import pytest
+import redis
+
+from src.utils import cache_decorator as cd
+
+
+class _DownRedis:
+    def __init__(self):
+        self.calls = 0
+
+    async def get(self, key):
+        self.calls += 1
+        raise redis.exceptions.ConnectionError("connection refused")
+
+    async def setex(self, key, ttl, value):
+        self.calls += 1
+        raise redis.exceptions.ConnectionError("connection refused")
+
+
+@pytest.mark.asyncio
+async def test_cache_response_skips_redis_during_cooldown(monkeypatch):
+    fake = _DownRedis()
+    monkeypatch.setattr(cd, "_async_redis_client", fake)
+    monkeypatch.setattr(cd, "_redis_down_until", 0.0)
+
+    @cd.cache_response(ttl=60)
+    async def compute(x):
+        return {"x": x}
+
+    assert await compute(1) == {"x": 1}
+    assert fake.calls == 1
+    assert cd.get_async_redis_client() is None
+
+    assert await compute(2) == {"x": 2}
+    assert fake.calls == 1
+
+
+def test_note_redis_error_ignores_non_connection_errors(monkeypatch):
+    monkeypatch.setattr(cd, "_redis_down_until", 0.0)
+    cd.note_redis_error(ValueError("bad json"))
+    assert cd._redis_down_until == 0.0
+
+
+class _UnreachableRedis:
+    def ping(self):
+        raise redis.exceptions.TimeoutError("timed out")
+
+
+def test_sync_client_failed_ping_starts_cooldown(monkeypatch):
+    created = []
+
+    def fake_from_url(url, **kwargs):
+        created.append(kwargs)
+        return _UnreachableRedis()
+
+    monkeypatch.setattr(cd.settings, "REDIS_URL", "redis://10.255.255.1:6379")
+    monkeypatch.setattr(cd.redis, "from_url", fake_from_url)
+    monkeypatch.setattr(cd, "_redis_client", None)
+    monkeypatch.setattr(cd, "_redis_down_until", 0.0)
+
+    assert cd.get_redis_client() is None
+    assert cd.get_redis_client() is None
+    assert len(created) == 1
+    assert created[0]["socket_connect_timeout"] == cd._REDIS_CONNECT_TIMEOUT
+    assert created[0]["socket_timeout"] == cd._REDIS_SOCKET_TIMEOUT
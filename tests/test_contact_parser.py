@@ -1,7 +1,7 @@
 """Unit tests for contact parser utilities"""
 
 import pytest
-from src.utils.contact_parser import parse_vcard, parse_csv, normalize_contact_picker_data
+from src.utils.contact_parser import clean_phone, parse_vcard, parse_csv, normalize_contact_picker_data
 
 
 class TestParseVCard:
@@ -143,6 +143,26 @@ Jane Smith,+0987654321,jane@example.com"""
         
         assert len(contacts) == 1
         assert contacts[0]["name"] == "Jane Smith"
+    
+    def test_parse_csv_semicolon_delimiter(self):
+        """Test CSV parsing detects semicolon-delimited files"""
+        csv_content = """name;phone
+John Doe;5551234567"""
+        
+        contacts = parse_csv(csv_content)
+        
+        assert len(contacts) == 1
+        assert contacts[0]["phone_number"] == "+15551234567"
+    
+    def test_parse_csv_single_column(self):
+        """Test CSV parsing handles a name-only file the sniffer can't classify"""
+        csv_content = """name
+John Doe
+Jane Smith"""
+        
+        contacts = parse_csv(csv_content)
+        
+        assert [c["name"] for c in contacts] == ["John Doe", "Jane Smith"]
 
 
 class TestNormalizeContactPickerData:
@@ -220,3 +240,8 @@ class TestNormalizeContactPickerData:
         assert normalized["phone_number"] is None
         assert normalized["email"] is None
 
+
+def test_clean_phone_keeps_digits_and_plus():
+    """Test phone cleaning drops punctuation and spaces"""
+    assert clean_phone("+1 (555) 123-4567") == "+15551234567"
+    assert clean_phone("ext. n/a") == ""
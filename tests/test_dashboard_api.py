@@ -0,0 +1,70 @@
+"""Tests for dashboard API routes"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.database.database import Base, get_db
+from src.database.models import Contact, Project, ProjectStakeholder, Suggestion
+from src.main import app
+
+# Dedicated DB for this module (keeps tests isolated and deterministic)
+engine = create_engine("sqlite:///./test_dashboard_api.db", connect_args={"check_same_thread": False})
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+def override_get_db():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@pytest.fixture(scope="function")
+def db_session():
+    Base.metadata.create_all(bind=engine)
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def client(db_session):
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        with TestClient(app) as c:
+            yield c
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+
+def test_network_heatmap_counts(client, db_session):
+    alice = Contact(name="Alice")
+    bob = Contact(name="Bob")
+    hidden = Contact(name="Hidden", is_sensitive=True)
+    p1 = Project(title="Launch")
+    p2 = Project(title="Fundraise")
+    db_session.add_all([alice, bob, hidden, p1, p2])
+    db_session.flush()
+    db_session.add_all([
+        ProjectStakeholder(project_id=p1.id, contact_id=alice.id),
+        ProjectStakeholder(project_id=p2.id, contact_id=alice.id),
+        Suggestion(suggestion_type="follow_up", contact_id=alice.id, intent="catch up", status="pending"),
+        Suggestion(suggestion_type="follow_up", contact_id=alice.id, intent="old", status="dismissed"),
+    ])
+    db_session.commit()
+
+    response = client.get("/api/dashboard/network-heatmap")
+
+    assert response.status_code == 200
+    by_name = {c["contact_name"]: c for c in response.json()["contacts"]}
+    assert set(by_name) == {"Alice", "Bob"}
+    assert by_name["Alice"]["project_count"] == 2
+    assert by_name["Alice"]["suggestion_count"] == 1
+    assert by_name["Bob"]["project_count"] == 0
+    assert by_name["Bob"]["suggestion_count"] == 0
+    assert by_name["Bob"]["sentiment_trend"] is None
@@ -0,0 +1,74 @@
+"""Tests for retry backoff helpers"""
+
+import httpx
+import pytest
+
+from src.utils import retry
+from src.utils.retry import retry_async_with_backoff, retry_with_backoff
+
+
+def _status_error(status_code: int, headers=None) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://example.com/")
+    response = httpx.Response(status_code, headers=headers or {}, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def test_backoff_schedule_is_capped():
+    assert retry._backoff_schedule(5, 1.0, 5.0, 2.0) == (1.0, 2.0, 4.0, 5.0, 5.0)
+
+
+@pytest.mark.parametrize(
+    "exc,expected",
+    [
+        (_status_error(429, {"Retry-After": "7"}), 7.0),
+        (_status_error(503, {"Retry-After": "0"}), 0.0),
+        (_status_error(429), None),
+        (_status_error(500, {"Retry-After": "7"}), None),
+        (_status_error(503, {"Retry-After": "soon"}), None),
+        (ValueError("boom"), None),
+    ],
+)
+def test_retry_after(exc, expected):
+    assert retry._retry_after(exc) == expected
+
+
+def test_retry_after_http_date_in_past_is_zero():
+    exc = _status_error(429, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+    assert retry._retry_after(exc) == 0.0
+
+
+def test_sync_retry_honors_retry_after(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(retry.time, "sleep", sleeps.append)
+    calls = {"n": 0}
+
+    @retry_with_backoff(max_retries=2, initial_delay=1.0, jitter=False)
+    def flaky():
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise _status_error(429, {"Retry-After": "3"})
+        if calls["n"] == 2:
+            raise ValueError("transient")
+        return "ok"
+
+    assert flaky() == "ok"
+    assert sleeps == [3.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_async_retry_uses_full_jitter_and_reraises(monkeypatch):
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(retry.asyncio, "sleep", fake_sleep)
+
+    @retry_async_with_backoff(max_retries=3, initial_delay=1.0, max_delay=2.0)
+    async def always_fails():
+        raise ValueError("nope")
+
+    with pytest.raises(ValueError):
+        await always_fails()
+    assert len(sleeps) == 3
+    assert all(0.0 <= s <= cap for s, cap in zip(sleeps, (1.0, 2.0, 2.0)))
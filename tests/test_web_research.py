@@ -0,0 +1,156 @@
+import pytest
+
+from src.tools.web_research import _is_allowed_host, strip_html, web_research
+
+
+@pytest.mark.parametrize(
+    "host, allow_hosts_csv, expected",
+    [
+        ("en.wikipedia.org", None, True),
+        ("docs.python.org", "", True),
+        ("example.com", None, False),
+        ("example.com", "Example.com, other.org", True),
+        ("other.org", "example.com,,other.org ", True),
+        ("evil.com", "example.com", False),
+    ],
+)
+def test_is_allowed_host(host, allow_hosts_csv, expected):
+    assert _is_allowed_host(host, allow_hosts_csv) is expected
+
+
+def test_strip_html_drops_scripts_styles_and_tags():
+    html = (
+        "<html><head><STYLE type='text/css'>p { color: red; }</STYLE>"
+        "<script>var x = '<b>';</script></head>"
+        "<body><h1>Title</h1>\n<p>Hello   <a href='/x'>world</a></p></body></html>"
+    )
+    assert strip_html(html) == "Title Hello world"
+
+
+@pytest.mark.asyncio
+async def test_web_research_rejects_unlisted_host():
+    with pytest.raises(ValueError, match="not allowlisted"):
+        await web_research("https://example.com/page")
+
+
+@pytest.mark.asyncio
+async def test_web_research_rejects_non_http_url():
+    with pytest.raises(ValueError, match="Invalid URL"):
+        await web_research("ftp://en.wikipedia.org/wiki/Python")
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+        self.ttls = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+        self.ttls[key] = ttl
+
+    async def expire(self, key, ttl):
+        self.ttls[key] = ttl
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_revalidates_with_etag(monkeypatch):
+    import httpx
+    from src.tools import web_research as wr
+
+    seen_headers = []
+
+    def handler(request):
+        seen_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="<p>hello</p>", headers={"ETag": '"v1"'})
+
+    fake_redis = _FakeRedis()
+    monkeypatch.setattr(wr, "get_async_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(wr, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    assert await wr.fetch_url("https://example.com/doc") == "<p>hello</p>"
+    assert await wr.fetch_url("https://example.com/doc") == "<p>hello</p>"
+    assert seen_headers == [None, '"v1"']
+    await wr.close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_truncates_at_max_bytes(monkeypatch):
+    import httpx
+    from src.tools import web_research as wr
+
+    def handler(request):
+        return httpx.Response(200, content=b"a" * 200_000)
+
+    monkeypatch.setattr(wr, "get_async_redis_client", lambda: None)
+    monkeypatch.setattr(wr, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    assert await wr.fetch_url("https://example.com/big", max_bytes=1000) == "a" * 1000
+    await wr.close_http_client()
+
+
+def test_web_research_imports_without_redis(monkeypatch):
+    import importlib
+    import sys
+
+    # Vercel deploys install api/requirements.txt, which does not include redis
+    for name in ("redis", "redis.asyncio"):
+        monkeypatch.setitem(sys.modules, name, None)
+    for name in ("src.utils.cache_decorator", "src.tools.web_research"):
+        package, _, attr = name.rpartition(".")
+        monkeypatch.setattr(sys.modules[package], attr, getattr(sys.modules[package], attr, None), raising=False)
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+    cd = importlib.import_module("src.utils.cache_decorator")
+    importlib.import_module("src.tools.web_research")
+
+    assert cd.get_async_redis_client() is None
+    assert cd.get_redis_client() is None
+    cd.note_redis_error(ConnectionError("down"))
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_does_not_cache_truncated_body(monkeypatch):
+    import httpx
+    from src.tools import web_research as wr
+
+    def handler(request):
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"a" * 1000, headers={"ETag": '"v1"'})
+
+    fake_redis = _FakeRedis()
+    monkeypatch.setattr(wr, "get_async_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(wr, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    assert await wr.fetch_url("https://example.com/doc", max_bytes=100) == "a" * 100
+    assert fake_redis.store == {}
+    assert await wr.fetch_url("https://example.com/doc") == "a" * 1000
+    await wr.close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_fetch_url_caps_revalidated_body_and_refreshes_ttl(monkeypatch):
+    import httpx
+    from src.tools import web_research as wr
+
+    def handler(request):
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"a" * 1000, headers={"ETag": '"v1"'})
+
+    fake_redis = _FakeRedis()
+    monkeypatch.setattr(wr, "get_async_redis_client", lambda: fake_redis)
+    monkeypatch.setattr(wr, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    assert await wr.fetch_url("https://example.com/doc") == "a" * 1000
+    (key,) = fake_redis.ttls
+    fake_redis.ttls[key] = 5
+
+    assert await wr.fetch_url("https://example.com/doc", max_bytes=100) == "a" * 100
+    assert fake_redis.ttls[key] == wr._PAGE_CACHE_TTL
+    await wr.close_http_client()